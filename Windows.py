@@ -1,27 +1,59 @@
+import concurrent.futures
+import mmap
 import tkinter as tk
-from tkinter import filedialog, messagebox
+from tkinter import filedialog, messagebox, font
 import os
 
+# Read files in fixed-size chunks so the event loop stays responsive
+CHUNK_SIZE = 262144  # 256 KB
+
+# Memory-map reads above this size instead of copying through read()
+MMAP_THRESHOLD = 33554432  # 32 MB
+
+# Characters that end a word and should start a new undo group
+UNDO_BOUNDARY_CHARS = " \t\n.,;:!?"
+
 class NotepadApp:
     def __init__(self, root):
         self.root = root
         self.root.title("Notepad")
         self.root.geometry("800x600")
         
-        # Currently opened file
+        # Currently opened file (basename cached so title/status updates
+        # don't re-parse the path on every call)
         self.current_file = None
-        
+        self._current_basename = None
+        self._current_stat = None  # os.stat of the file as it was loaded/saved
+
+        # Background pool for disk I/O so reads/writes never block the UI
+        self._io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+        self._io_busy = False        # True while a load/save owns the file menu
+        self._pending_action = None  # Action resumed after a prompted save
+
         # Create menu
         self.create_menu()
-        
+
+        # Named font: Tk caches glyph metrics per named font, so widget
+        # metric queries skip re-parsing a ('Arial', 12) tuple spec
+        self._editor_font = font.Font(family="Arial", size=12, name="EditorFont")
+
         # Create text widget
         self.create_text_widget()
         
-        # Add status bar
-        self.status_bar = tk.Label(root, text="Ready", bd=1, relief=tk.SUNKEN, anchor=tk.W)
+        # Add status bar (textvariable-backed so updates are a plain
+        # variable write instead of a configure round-trip)
+        self._status_var = tk.StringVar(value="Ready")
+        self.status_bar = tk.Label(root, textvariable=self._status_var, bd=1,
+                                   relief=tk.SUNKEN, anchor=tk.W)
         self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
         
         # Bind event handlers
+        self._status_after = None  # Pending debounced status update, if any
+        self._loading = False      # True while a file load owns the buffer
+        # True once the buffer diverges from disk. Unlike edit_modified(),
+        # discarding changes at a prompt does not clear this, so reopening
+        # the current file to revert still reloads from disk.
+        self._buffer_dirty = False
         self.text.bind("<<Modified>>", self.on_text_modified)
         
     def create_menu(self):
@@ -37,33 +69,52 @@ class NotepadApp:
         file_menu.add_separator()
         file_menu.add_command(label="Exit", command=self.exit_app)
         menubar.add_cascade(label="File", menu=file_menu)
+        self.file_menu = file_menu  # Kept so entries can be disabled during I/O
         
-        # Edit menu
-        edit_menu = tk.Menu(menubar, tearoff=0)
-        edit_menu.add_command(label="Undo", command=self.undo_text, accelerator="Ctrl+Z")
-        edit_menu.add_command(label="Redo", command=self.redo_text, accelerator="Ctrl+Y")
-        edit_menu.add_separator()
-        edit_menu.add_command(label="Cut", command=self.cut_text, accelerator="Ctrl+X")
-        edit_menu.add_command(label="Copy", command=self.copy_text, accelerator="Ctrl+C")
-        edit_menu.add_command(label="Paste", command=self.paste_text, accelerator="Ctrl+V")
-        edit_menu.add_separator()
-        edit_menu.add_command(label="Select All", command=self.select_all, accelerator="Ctrl+A")
-        menubar.add_cascade(label="Edit", menu=edit_menu)
-        
-        # Help menu
-        help_menu = tk.Menu(menubar, tearoff=0)
-        help_menu.add_command(label="About", command=self.about_app)
-        menubar.add_cascade(label="Help", menu=help_menu)
-        
+        # Edit and Help menus are populated lazily the first time they are
+        # posted, keeping their add_command Tcl calls off the startup path
+        self._edit_menu = tk.Menu(menubar, tearoff=0, postcommand=self._build_edit_menu)
+        self._edit_built = False
+        menubar.add_cascade(label="Edit", menu=self._edit_menu)
+
+        self._help_menu = tk.Menu(menubar, tearoff=0, postcommand=self._build_help_menu)
+        self._help_built = False
+        menubar.add_cascade(label="Help", menu=self._help_menu)
+
         self.root.config(menu=menubar)
         
-        # Hotkeys
-        self.root.bind('<Control-n>', lambda e: self.new_file())
-        self.root.bind('<Control-o>', lambda e: self.open_file())
-        self.root.bind('<Control-s>', lambda e: self.save_file())
-        self.root.bind('<Control-S>', lambda e: self.save_as_file())  # Ctrl+Shift+S
-        self.root.bind('<Control-a>', lambda e: self.select_all())
-        
+        # Hotkeys: bind_all registers them in the application-wide binding
+        # table Tk consults first during dispatch, one pass for all of them
+        for sequence, callback in (
+                ('<Control-n>', self.new_file),
+                ('<Control-o>', self.open_file),
+                ('<Control-s>', self.save_file),
+                ('<Control-S>', self.save_as_file),  # Ctrl+Shift+S
+                ('<Control-a>', self.select_all)):
+            self.root.bind_all(sequence, lambda e, cb=callback: cb())
+
+    def _build_edit_menu(self):
+        """Populate the Edit menu on first open"""
+        if self._edit_built:
+            return
+        self._edit_built = True
+        menu = self._edit_menu
+        menu.add_command(label="Undo", command=self.undo_text, accelerator="Ctrl+Z")
+        menu.add_command(label="Redo", command=self.redo_text, accelerator="Ctrl+Y")
+        menu.add_separator()
+        menu.add_command(label="Cut", command=self.cut_text, accelerator="Ctrl+X")
+        menu.add_command(label="Copy", command=self.copy_text, accelerator="Ctrl+C")
+        menu.add_command(label="Paste", command=self.paste_text, accelerator="Ctrl+V")
+        menu.add_separator()
+        menu.add_command(label="Select All", command=self.select_all, accelerator="Ctrl+A")
+
+    def _build_help_menu(self):
+        """Populate the Help menu on first open"""
+        if self._help_built:
+            return
+        self._help_built = True
+        self._help_menu.add_command(label="About", command=self.about_app)
+
     def create_text_widget(self):
         """Create text widget with scrollbars"""
         # Frame for text widget and scrollbars
@@ -83,27 +134,60 @@ class NotepadApp:
             text_frame,
             wrap=tk.NONE,  # Disable word wrap for horizontal scrolling
             undo=True,      # Enable undo functionality
+            maxundo=200,    # Cap undo history so memory stays bounded
+            autoseparators=False,  # Separators are emitted on word boundaries instead
             yscrollcommand=scrollbar_y.set,
             xscrollcommand=scrollbar_x.set,
-            font=("Arial", 12)
+            font=self._editor_font
         )
         self.text.pack(expand=True, fill=tk.BOTH)
         
         # Configure scrollbars
         scrollbar_y.config(command=self.text.yview)
         scrollbar_x.config(command=self.text.xview)
-        
+
+        # Group undo records into words rather than single characters
+        self._undo_sep_after = None
+        self.text.bind('<KeyRelease>', self._coalesce_undo, add='+')
+
+    def _coalesce_undo(self, event):
+        """Emit undo separators on word boundaries or after a typing pause"""
+        if event.char and event.char in UNDO_BOUNDARY_CHARS:
+            self.text.edit_separator()
+        # Also close the group after 500 ms of idle typing
+        if self._undo_sep_after:
+            self.root.after_cancel(self._undo_sep_after)
+        self._undo_sep_after = self.root.after(500, self._idle_undo_separator)
+
+    def _idle_undo_separator(self):
+        """Close the current undo group after a pause in typing"""
+        self._undo_sep_after = None
+        self.text.edit_separator()
+
+    def _set_current_file(self, file_path):
+        """Remember the opened file; cache its basename and on-disk stat"""
+        self.current_file = file_path
+        self._current_basename = os.path.basename(file_path) if file_path else None
+        try:
+            self._current_stat = os.stat(file_path) if file_path else None
+        except OSError:
+            self._current_stat = None
+
     def new_file(self):
         """Create a new file"""
-        if self.check_unsaved_changes():
+        if self._io_busy:
+            return
+        if self.check_unsaved_changes(self.new_file):
             self.text.delete(1.0, tk.END)
-            self.current_file = None
+            self._set_current_file(None)
             self.update_title()
             self.update_status("New file created")
             
     def open_file(self):
         """Open file through file dialog"""
-        if self.check_unsaved_changes():
+        if self._io_busy:
+            return
+        if self.check_unsaved_changes(self.open_file):
             file_path = filedialog.askopenfilename(
                 title="Open File",
                 filetypes=[
@@ -114,35 +198,126 @@ class NotepadApp:
             )
             
             if file_path:
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as file:
-                        content = file.read()
-                    
-                    self.text.delete(1.0, tk.END)
-                    self.text.insert(1.0, content)
-                    self.current_file = file_path
-                    self.update_title()
-                    self.update_status(f"Opened file: {os.path.basename(file_path)}")
-                    
-                except Exception as e:
-                    messagebox.showerror("Error", f"Failed to open file:\n{str(e)}")
-                    
+                self.load_file(file_path)
+
+    def load_file(self, file_path):
+        """Read a file in a worker thread, then insert it on the Tk thread"""
+        # Reopening the already-loaded file is a no-op only while the
+        # buffer still matches it; a dirty (or discarded-dirty) buffer
+        # must reload so "reopen to revert" works
+        if (file_path == self.current_file and not self._buffer_dirty
+                and self._current_stat is not None):
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                st = None
+            if st and ((st.st_mtime_ns, st.st_size) ==
+                       (self._current_stat.st_mtime_ns, self._current_stat.st_size)):
+                self.update_status("Already open")
+                return
+
+        self._set_io_menus_enabled(False)
+        self.update_status(f"Opening {os.path.basename(file_path)}...")
+        future = self._io_pool.submit(self._read_file, file_path)
+        future.add_done_callback(
+            lambda f: self.root.after(0, self._apply_loaded, f, file_path))
+
+    @staticmethod
+    def _read_file(file_path):
+        """Blocking read; runs on the I/O pool, never on the Tk thread"""
+        # Binary read + one bulk decode: a single C-level UTF-8 pass beats
+        # the incremental decoding done by text-mode I/O
+        with open(file_path, 'rb') as file:
+            if os.fstat(file.fileno()).st_size >= MMAP_THRESHOLD:
+                # Big file: let the OS page it in on demand rather than
+                # copying kernel buffers through an intermediate read()
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return mm[:].decode('utf-8')
+            data = file.read()
+        return data.decode('utf-8')
+
+    def _apply_loaded(self, future, file_path):
+        """Apply a finished background read to the text widget (Tk thread)"""
+        try:
+            content = future.result()
+        except Exception as e:
+            self._set_io_menus_enabled(True)
+            messagebox.showerror("Error", f"Failed to open file:\n{str(e)}")
+            self.update_status("Ready")
+            return
+
+        self._loading = True  # Silence <<Modified>> handling per slab
+        self.text.delete(1.0, tk.END)
+        # Keep user keystrokes out of the document while slabs stream in;
+        # each insert below briefly re-enables the widget for itself
+        self.text.config(state=tk.DISABLED)
+        self._set_current_file(file_path)
+        self.update_title()
+        self._insert_next_slab(self._split_slabs(content), 0, 0)
+
+    @staticmethod
+    def _split_slabs(content):
+        """Split content into ~CHUNK_SIZE slabs snapped to line boundaries"""
+        # Whole-line slabs let Tk's text B-tree grow in large leaves
+        # instead of splicing a partial line on every insert
+        slabs = []
+        start = 0
+        length = len(content)
+        while start < length:
+            end = start + CHUNK_SIZE
+            if end < length:
+                newline = content.find('\n', end)
+                end = length if newline == -1 else newline + 1
+            else:
+                end = length
+            slabs.append(content[start:end])
+            start = end
+        return slabs
+
+    def _insert_next_slab(self, slabs, index, chars_loaded):
+        """Insert one slab, then reschedule until all slabs are in"""
+        if index < len(slabs):
+            slab = slabs[index]
+            self.text.config(state=tk.NORMAL)
+            self.text.insert(tk.END, slab)
+            self.text.config(state=tk.DISABLED)
+            chars_loaded += len(slab)
+            self.update_status(f"Loading... {chars_loaded} characters")
+            # Let the event loop breathe between slabs
+            self.root.after_idle(self._insert_next_slab, slabs, index + 1, chars_loaded)
+        else:
+            self.text.config(state=tk.NORMAL)
+            self.text.mark_set(tk.INSERT, "1.0")
+            self.text.edit_modified(False)  # Loading is not a user edit
+            self._buffer_dirty = False
+            self._loading = False
+            # File commands stay disabled until the last slab is in, so a
+            # save can never snapshot a half-streamed buffer
+            self._set_io_menus_enabled(True)
+            self.update_status(f"Opened file: {self._current_basename}")
+
+    def _set_io_menus_enabled(self, enabled):
+        """Toggle file menu entries while a background load/save is in flight"""
+        # The flag mirrors the menu state so the bind_all hotkeys, which
+        # bypass disabled menu entries, can bail out during I/O too
+        self._io_busy = not enabled
+        state = tk.NORMAL if enabled else tk.DISABLED
+        for label in ("Open...", "Save", "Save As..."):
+            self.file_menu.entryconfig(label, state=state)
+
     def save_file(self):
         """Save file"""
+        if self._io_busy:
+            return  # Never snapshot a half-loaded buffer
         if self.current_file:
-            try:
-                content = self.text.get(1.0, tk.END)
-                with open(self.current_file, 'w', encoding='utf-8') as file:
-                    file.write(content)
-                self.update_status(f"File saved: {os.path.basename(self.current_file)}")
-                self.text.edit_modified(False)  # Reset modified flag
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to save file:\n{str(e)}")
+            self._save_to(self.current_file)
         else:
             self.save_as_file()
-            
+
     def save_as_file(self):
         """Save file as... through file dialog"""
+        if self._io_busy:
+            return
         file_path = filedialog.asksaveasfilename(
             title="Save As",
             filetypes=[
@@ -151,33 +326,84 @@ class NotepadApp:
             ],
             defaultextension=".txt"
         )
-        
+
         if file_path:
-            try:
-                content = self.text.get(1.0, tk.END)
-                with open(file_path, 'w', encoding='utf-8') as file:
-                    file.write(content)
-                
-                self.current_file = file_path
-                self.update_title()
-                self.update_status(f"File saved as: {os.path.basename(file_path)}")
-                self.text.edit_modified(False)  # Reset modified flag
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to save file:\n{str(e)}")
-                
-    def check_unsaved_changes(self):
-        """Check for unsaved changes"""
+            self._save_to(file_path)
+        else:
+            self._pending_action = None  # Save As cancelled; drop queued action
+
+    def _save_to(self, file_path):
+        """Write the buffer in a worker thread, then finish on the Tk thread"""
+        # Pull the buffer out line-by-line so the full document is never
+        # materialized as one giant string alongside Tk's internal copy.
+        # The last line stops at '.end' rather than '.end+1c' so the
+        # newline Tk synthesizes past the buffer never reaches disk.
+        last_line = int(self.text.index('end-1c').split('.')[0])
+        lines = [self.text.get(f"{i}.0", f"{i}.end+1c")
+                 for i in range(1, last_line)]
+        lines.append(self.text.get(f"{last_line}.0", f"{last_line}.end"))
+        self._set_io_menus_enabled(False)
+        self.update_status(f"Saving {os.path.basename(file_path)}...")
+        future = self._io_pool.submit(self._write_file, file_path, lines)
+        future.add_done_callback(
+            lambda f: self.root.after(0, self._apply_saved, f, file_path))
+
+    @staticmethod
+    def _write_file(file_path, lines):
+        """Blocking write; runs on the I/O pool, never on the Tk thread"""
+        # Write to a sibling temp file, fsync it, and rename it into place
+        # here in the worker: a crash mid-write can never corrupt the
+        # target, and exit_app's pool shutdown (which waits for workers,
+        # not for Tk callbacks) guarantees an in-flight save still lands
+        tmp_path = file_path + '.tmp'
+        with open(tmp_path, 'wb', buffering=1 << 20) as file:
+            for line in lines:
+                file.write(line.encode('utf-8'))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, file_path)
+
+    def _apply_saved(self, future, file_path):
+        """Finish a background save on the Tk thread"""
+        self._set_io_menus_enabled(True)
+        try:
+            future.result()
+        except Exception as e:
+            self._pending_action = None  # Don't continue past a failed save
+            messagebox.showerror("Error", f"Failed to save file:\n{str(e)}")
+            return
+
+        self._set_current_file(file_path)
+        self.update_title()
+        self.update_status(f"File saved: {self._current_basename}")
+        self.text.edit_modified(False)  # Reset modified flag
+        self._buffer_dirty = False
+
+        # Resume whatever the save-prompt interrupted (New/Open/Exit)
+        pending, self._pending_action = self._pending_action, None
+        if pending:
+            pending()
+
+    def check_unsaved_changes(self, pending_action=None):
+        """Check for unsaved changes
+
+        Saves run on the I/O pool, so a "Yes" answer cannot block until
+        the write lands. Instead the caller's action is queued and re-run
+        from the save completion callback, and this returns False so the
+        caller backs out for now.
+        """
         if self.text.edit_modified():
             response = messagebox.askyesnocancel(
                 "Unsaved Changes",
                 "You have unsaved changes. Save?"
             )
-            
+
             if response is None:  # Cancel
                 return False
             elif response:  # Yes
+                self._pending_action = pending_action
                 self.save_file()
-                return not self.text.edit_modified()  # Return True if saved successfully
+                return False  # _apply_saved resumes pending_action
             else:  # No
                 self.text.edit_modified(False)
                 return True
@@ -186,17 +412,27 @@ class NotepadApp:
     def update_title(self):
         """Update window title"""
         if self.current_file:
-            filename = os.path.basename(self.current_file)
-            self.root.title(f"Notepad - {filename}")
+            self.root.title(f"Notepad - {self._current_basename}")
         else:
             self.root.title("Notepad - New File")
             
     def update_status(self, message):
         """Update status bar"""
-        self.status_bar.config(text=message)
+        self._status_var.set(message)
         
     def on_text_modified(self, event=None):
-        """Text modification handler"""
+        """Text modification handler (debounced to ~1 update per 100 ms)"""
+        if self._loading:
+            return  # Programmatic inserts are not user edits
+        if self.text.edit_modified():
+            self._buffer_dirty = True
+        if self._status_after:
+            self.root.after_cancel(self._status_after)
+        self._status_after = self.root.after(100, self._flush_status)
+
+    def _flush_status(self):
+        """Reflect the modified flag in the status bar"""
+        self._status_after = None
         if self.text.edit_modified():
             self.update_status("Changes not saved")
         else:
@@ -204,16 +440,22 @@ class NotepadApp:
             
     def undo_text(self):
         """Undo last action"""
+        # edit('canundo') is a cheap boolean query, so holding Ctrl+Z at
+        # the bottom of the history never allocates a TclError
+        if not self.text.tk.getboolean(self.text.edit("canundo")):
+            return
         try:
             self.text.edit_undo()
-        except:
+        except tk.TclError:
             pass
-            
+
     def redo_text(self):
         """Redo last action"""
+        if not self.text.tk.getboolean(self.text.edit("canredo")):
+            return
         try:
             self.text.edit_redo()
-        except:
+        except tk.TclError:
             pass
             
     def cut_text(self):
@@ -230,9 +472,9 @@ class NotepadApp:
         
     def select_all(self):
         """Select all text"""
-        self.text.tag_add(tk.SEL, "1.0", tk.END)
-        self.text.mark_set(tk.INSERT, "1.0")
-        self.text.see(tk.INSERT)
+        # Tk's built-in handler sets the selection in one C-level call,
+        # instead of three round-trips (tag_add + mark_set + see)
+        self.text.event_generate("<<SelectAll>>")
         return 'break'  # Prevent default behavior
         
     def about_app(self):
@@ -254,7 +496,8 @@ class NotepadApp:
         
     def exit_app(self):
         """Exit the program"""
-        if self.check_unsaved_changes():
+        if self.check_unsaved_changes(self.exit_app):
+            self._io_pool.shutdown(wait=True)  # Let in-flight saves finish
             self.root.quit()
 
 def main():
@@ -1,39 +1,166 @@
-```python
 #!/usr/bin/env python3
 """
 Linux Notepad - Optimized text editor for Linux
 """
 
 import tkinter as tk
-from tkinter import filedialog, messagebox, font
+from tkinter import filedialog, messagebox, font, simpledialog, ttk
+import ast
+import codecs
+import functools
+import math
 import os
 import sys
+import shutil
 import subprocess
 import platform
 import configparser
+import time
+from collections import OrderedDict
 from pathlib import Path
 
+# How long a cached GTK theme probe stays valid (seconds)
+THEME_CACHE_TTL = 3600
+
+# Encodings tried when opening a file, and how much of the file is
+# test-decoded to pick one
+ENCODING_CANDIDATES = ('utf-8', 'cp1251', 'iso-8859-1')
+ENCODING_SNIFF_SIZE = 65536  # 64 KiB
+
+# Static half of the System Information dialog; the platform module
+# shells out for some of these, so compute the block once at import
+_SYS_INFO_STATIC = f"""System Information:
+
+OS: {platform.system()} {platform.release()}
+Architecture: {platform.machine()}
+Processor: {platform.processor()}
+
+Python: {platform.python_version()}
+Tkinter: {tk.TkVersion}"""
+
+# Help > User Manual contents
+_MANUAL_TEXT = """LINUX NOTEPAD USER MANUAL
+
+1. EDITING FILES
+   - Use standard cut/copy/paste commands
+   - Configure font through Format menu
+   - Enable word wrap for comfortable reading
+
+2. WORKING WITH FILES
+   - Save files in any format
+   - Open files in different encodings
+   - Use recent files list for quick access
+
+3. TOOLS
+   - Python syntax checking
+   - Run scripts directly from editor
+   - Code formatting
+   - Line ending conversion
+
+4. LINUX INTEGRATION
+   - Open terminal in current folder
+   - View files in file manager
+   - Automatic system theme detection"""
+
+# Names usable in Calculate Expression (math functions and constants)
+_SAFE_NAMES = {name: getattr(math, name)
+               for name in dir(math) if not name.startswith('_')}
+
+# AST nodes an arithmetic expression may contain
+_ALLOWED_NODES = (ast.Expression, ast.BinOp, ast.UnaryOp, ast.Constant,
+                  ast.Name, ast.Load, ast.Call, ast.operator, ast.unaryop)
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_expression(expr):
+    """Validate and compile an arithmetic expression (cached per string)"""
+    tree = ast.parse(expr, mode='eval')
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise ValueError(f"Unsupported element: {type(node).__name__}")
+        if isinstance(node, ast.Name) and node.id not in _SAFE_NAMES:
+            raise ValueError(f"Unknown name: {node.id}")
+        if isinstance(node, ast.Call) and not isinstance(node.func, ast.Name):
+            raise ValueError("Only direct function calls are allowed")
+    return compile(tree, '<calc>', 'eval')
+
+
+def _evaluate_expression(expr):
+    """Evaluate a validated math expression with no builtins exposed"""
+    code = _compile_expression(expr)
+    return eval(code, {'__builtins__': {}}, _SAFE_NAMES)
+
+
+# Indent prefixes for _format_lines, precomputed so the hot loop does a
+# tuple index instead of building a fresh ' ' * n string per line
+_INDENTS = tuple(' ' * (4 * level) for level in range(128))
+
+
+def _format_lines(content):
+    """Re-indent lines using the editor's simple block heuristic"""
+    # One strip per line and a single join at the end; the old loop
+    # stripped some lines twice and branched on already-stripped copies
+    formatted_lines = []
+    indent_level = 0
+    for line in content.split('\n'):
+        stripped = line.strip()
+        if stripped.endswith(':'):
+            pre = _INDENTS[indent_level] if indent_level < 128 else ' ' * (indent_level * 4)
+            formatted_lines.append(pre + stripped)
+            indent_level += 1
+        else:
+            if stripped and stripped[0] in ')]}':
+                indent_level = max(0, indent_level - 1)
+            pre = _INDENTS[indent_level] if indent_level < 128 else ' ' * (indent_level * 4)
+            formatted_lines.append(pre + stripped)
+    return '\n'.join(formatted_lines)
+
 class LinuxNotepad:
+    # Sorted font families, enumerated once per process on first use
+    _font_families_cache = None
+
     def __init__(self, root):
         self.root = root
         self.root.title("Linux Notepad")
         
-        # Detect theme based on environment
-        self.detect_linux_theme()
-        
         # Paths for Linux configuration
         self.config_dir = Path.home() / '.config' / 'linux-notepad'
         self.config_file = self.config_dir / 'config.ini'
         self.recent_files_file = self.config_dir / 'recent_files.txt'
-        
+
         # Create configuration directories
         self.config_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Load configuration
+
+        # Load configuration; changes are buffered in memory and flushed
+        # periodically and on exit, not rewritten per key
         self.config = self.load_config()
-        
-        # Currently opened file
+        self._config_dirty = False
+        self._recent_dirty = False
+        self.root.after(5000, self._flush_dirty_state)
+        # Route the window-manager close button through exit_app so its
+        # final flush runs there too, not just from the Exit menu entry
+        self.root.protocol('WM_DELETE_WINDOW', self.exit_app)
+
+        # Detect theme based on environment (after config, so the cached
+        # result can be used without probing)
+        self.detect_linux_theme()
+
+        # Resolve helper programs once; shutil.which walks PATH in-process
+        # instead of forking `which` per candidate on every menu action
+        self._terminal = next(
+            (t for t in ('gnome-terminal', 'konsole', 'xfce4-terminal', 'xterm')
+             if shutil.which(t)), None)
+        self._file_manager = next(
+            (fm for fm in ('nautilus', 'dolphin', 'thunar', 'pcmanfm')
+             if shutil.which(fm)), None)
+        
+        # Currently opened file (basename cached so the per-keystroke
+        # status/title paths don't re-parse the path)
         self.current_file = None
+        self._current_basename = None
+        self._syntax_cache = None  # (path, mtime_ns) of the last clean check
+        self._manual_window = None  # User Manual Toplevel, built on first use
+        self._buf_cache = None      # Full-buffer snapshot, dropped on any edit
         self.recent_files = self.load_recent_files()
         
         # Set geometry from configuration
@@ -61,53 +188,81 @@ class LinuxNotepad:
         # Bind Linux hotkeys
         self.bind_linux_shortcuts()
         
-        # Track window resize
+        # Track window resize (persisted with a debounce, not per pixel)
+        self._resize_after = None
         self.root.bind('<Configure>', self.on_window_resize)
         
         # Load last opened file if exists
         self.load_last_file()
         
     def detect_linux_theme(self):
-        """Detect Linux environment theme"""
+        """Detect Linux environment theme (result cached in config.ini)"""
         try:
-            # Check GTK theme
-            if os.path.exists('/usr/bin/gsettings'):
-                result = subprocess.run(
-                    ['gsettings', 'get', 'org.gnome.desktop.interface', 'gtk-theme'],
-                    capture_output=True, text=True
-                )
-                theme = result.stdout.strip().strip("'")
-                if 'dark' in theme.lower():
-                    self.is_dark_theme = True
-                else:
-                    self.is_dark_theme = False
+            cached = self.config.get('theme', 'value', fallback=None)
+            cached_ts = self.config.getfloat('theme', 'ts', fallback=0)
+            if cached is not None and time.time() - cached_ts < THEME_CACHE_TTL:
+                # Fresh cache: no probing at all on this launch
+                self.is_dark_theme = (cached == 'dark')
             else:
-                self.is_dark_theme = False
-                
+                theme = self._probe_gtk_theme()
+                self.is_dark_theme = 'dark' in theme.lower()
+                self.save_config('theme', 'value',
+                                 'dark' if self.is_dark_theme else 'light')
+                self.save_config('theme', 'ts', str(time.time()))
+
             # Apply tkinter theme
             if self.is_dark_theme:
                 self.root.tk_setPalette(background='#2d2d2d', foreground='#ffffff')
-        except:
+        except Exception:
             self.is_dark_theme = False
+
+    @staticmethod
+    def _probe_gtk_theme():
+        """Find the GTK theme name, forking gsettings only as a last resort"""
+        # $GTK_THEME and gtk-3.0/settings.ini are plain reads; fork+exec of
+        # gsettings costs tens of ms of startup and is rarely needed
+        env_theme = os.environ.get('GTK_THEME')
+        if env_theme:
+            return env_theme
+
+        settings_file = Path.home() / '.config' / 'gtk-3.0' / 'settings.ini'
+        parser = configparser.ConfigParser()
+        if parser.read(settings_file) and parser.has_option('Settings', 'gtk-theme-name'):
+            return parser.get('Settings', 'gtk-theme-name')
+
+        if os.path.exists('/usr/bin/gsettings'):
+            result = subprocess.run(
+                ['gsettings', 'get', 'org.gnome.desktop.interface', 'gtk-theme'],
+                capture_output=True, text=True
+            )
+            return result.stdout.strip().strip("'")
+        return ''
             
     def set_linux_icon(self):
         """Set icon for Linux"""
-        # Try to use system editor icon
-        icon_paths = [
-            '/usr/share/icons/hicolor/48x48/apps/accessories-text-editor.png',
-            '/usr/share/icons/gnome/48x48/apps/accessories-text-editor.png',
-            '/usr/share/pixmaps/gedit.png',
-            '/usr/share/icons/hicolor/48x48/apps/gedit.png'
-        ]
-        
-        for icon_path in icon_paths:
-            if os.path.exists(icon_path):
-                try:
-                    icon = tk.PhotoImage(file=icon_path)
-                    self.root.iconphoto(True, icon)
-                    break
-                except:
-                    continue
+        # The resolved path is cached in config.ini on first run, so later
+        # launches do a single stat instead of probing every candidate
+        icon_path = self.config.get('ui', 'icon_path', fallback=None)
+        if icon_path and not os.path.exists(icon_path):
+            icon_path = None  # Cached icon vanished; re-probe
+
+        if icon_path is None:
+            # Try to use system editor icon
+            icon_paths = [
+                '/usr/share/icons/hicolor/48x48/apps/accessories-text-editor.png',
+                '/usr/share/icons/gnome/48x48/apps/accessories-text-editor.png',
+                '/usr/share/pixmaps/gedit.png',
+                '/usr/share/icons/hicolor/48x48/apps/gedit.png'
+            ]
+            icon_path = next((p for p in icon_paths if os.path.exists(p)), '')
+            self.save_config('ui', 'icon_path', icon_path)
+
+        if icon_path:
+            try:
+                icon = tk.PhotoImage(file=icon_path)
+                self.root.iconphoto(True, icon)
+            except tk.TclError:
+                pass
                     
     def create_menu(self):
         """Create menu considering Linux traditions"""
@@ -121,20 +276,13 @@ class LinuxNotepad:
                             accelerator="Ctrl+O")
         file_menu.add_separator()
         
-        # Recent files
-        if self.recent_files:
-            recent_menu = tk.Menu(file_menu, tearoff=0)
-            for recent_file in self.recent_files[:10]:  # Last 10 files
-                display_name = os.path.basename(recent_file)[:30] + "..." \
-                             if len(os.path.basename(recent_file)) > 30 \
-                             else os.path.basename(recent_file)
-                recent_menu.add_command(
-                    label=f"{display_name}",
-                    command=lambda f=recent_file: self.open_recent_file(f)
-                )
-            file_menu.add_cascade(label="Recent Files", menu=recent_menu)
-            file_menu.add_separator()
-        
+        # Recent files: the submenu is rebuilt by its postcommand each time
+        # it is posted, so no entries are constructed at startup
+        self.recent_menu = tk.Menu(file_menu, tearoff=0,
+                                   postcommand=self._populate_recent_menu)
+        file_menu.add_cascade(label="Recent Files", menu=self.recent_menu)
+        file_menu.add_separator()
+
         file_menu.add_command(label="Save", command=self.save_file,
                             accelerator="Ctrl+S")
         file_menu.add_command(label="Save As...", command=self.save_as_file,
@@ -213,22 +361,40 @@ class LinuxNotepad:
         menubar.add_cascade(label="Help", menu=help_menu)
         
         self.root.config(menu=menubar)
-        
+
+    def _populate_recent_menu(self):
+        """(Re)build the Recent Files submenu as it is posted"""
+        menu = self.recent_menu
+        menu.delete(0, 'end')
+        # One C-level partial per entry (cheaper than a lambda frame), each
+        # capturing just a small index into the snapshot list
+        self._recent_files_list = list(self.recent_files)[:10]  # Last 10 files
+        for i, recent_file in enumerate(self._recent_files_list):
+            basename = os.path.basename(recent_file)
+            display_name = basename[:30] + "..." if len(basename) > 30 else basename
+            menu.add_command(
+                label=display_name,
+                command=functools.partial(self._open_recent_idx, i)
+            )
+
+    def _open_recent_idx(self, index):
+        """Dispatch a Recent Files entry by its index in the posted menu"""
+        self.open_recent_file(self._recent_files_list[index])
+
     def create_text_widget(self):
         """Create text widget with Linux support"""
         # Main frame
         main_frame = tk.Frame(self.root)
         main_frame.pack(fill=tk.BOTH, expand=True, padx=2, pady=2)
         
-        # Frame for line numbers
-        self.line_numbers = tk.Text(
+        # Line-number gutter: a Canvas that only draws the visible lines,
+        # so its cost is O(viewport) instead of O(document)
+        self.line_numbers = tk.Canvas(
             main_frame,
-            width=4,
-            padx=3,
+            width=40,
             takefocus=0,
-            border=0,
-            background='lightgray',
-            state='disabled'
+            highlightthickness=0,
+            background='lightgray'
         )
         self.line_numbers.pack(side=tk.LEFT, fill=tk.Y)
         
@@ -244,6 +410,12 @@ class LinuxNotepad:
         h_scrollbar = tk.Scrollbar(text_frame, orient=tk.HORIZONTAL)
         h_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
         
+        # Named editor font: zoom and the font dialog mutate this one
+        # object and every widget using it follows, no tuple re-parsing
+        self.editor_font = font.Font(
+            family=self.config.get('editor', 'font_family', fallback='Monospace'),
+            size=self.config.getint('editor', 'font_size', fallback=12))
+
         # Text field
         self.text = tk.Text(
             text_frame,
@@ -251,21 +423,41 @@ class LinuxNotepad:
             undo=True,
             autoseparators=True,
             maxundo=-1,
-            yscrollcommand=v_scrollbar.set,
+            yscrollcommand=self._on_text_scroll,
             xscrollcommand=h_scrollbar.set,
-            font=(self.config.get('editor', 'font_family', fallback='Monospace'),
-                  self.config.getint('editor', 'font_size', fallback=12)),
+            font=self.editor_font,
+            # Keep the sel tag out of the X PRIMARY selection; exporting a
+            # whole-document selection copies the full buffer to the server
+            exportselection=False,
             tabs=(self.config.getint('editor', 'tab_width', fallback=4) * 8)
         )
         self.text.pack(fill=tk.BOTH, expand=True)
         
         # Configure scrollbars
+        self._v_scrollbar = v_scrollbar
         v_scrollbar.config(command=self.text.yview)
         h_scrollbar.config(command=self.text.xview)
-        
-        # Bind events for line numbers
-        self.text.bind('<KeyRelease>', self.update_line_numbers)
-        self.text.bind('<ButtonRelease>', self.update_line_numbers)
+
+        # Share the editor's font metrics with the gutter so the numbers
+        # line up with their lines and the width fits the digit count
+        self._gutter_font = font.Font(**self.editor_font.actual())
+        self._gutter_width = self._gutter_font.measure('0') * 4 + 8
+        self.line_numbers.config(width=self._gutter_width)
+
+        # One handler per event: widget-level bind replaces rather than
+        # stacks, so separate gutter/cursor bindings would clobber each other
+        self._gutter_after = None    # Pending debounced gutter refresh
+        self._modified_after = None  # Pending debounced modified-status update
+        self._last_modified_state = False
+        self._zoom_pending = 0       # Accumulated zoom steps not yet applied
+        self._zoom_after = None
+        # Snapshot invalidation must happen on press: insertions land on
+        # <Key>, and a held key can fire Ctrl+S before any release arrives
+        self.text.bind('<Key>', self._drop_buffer_snapshot, add='+')
+        self.text.bind('<Button>', self._drop_buffer_snapshot, add='+')  # middle-click paste
+        self.text.bind('<KeyRelease>', self._on_key_or_click)
+        self.text.bind('<ButtonRelease>', self._on_key_or_click)
+        self.text.bind('<Configure>', self.update_line_numbers)
         self.text.bind('<<Modified>>', self.on_text_modified)
         
         # Context menu for Linux
@@ -292,9 +484,14 @@ class LinuxNotepad:
         
     def create_toolbar(self):
         """Create toolbar"""
-        toolbar = tk.Frame(self.root, relief=tk.RAISED, bd=1)
+        # ttk widgets share one themed style object, so the ten buttons
+        # are cheaper to create and redraw than individual tk.Buttons
+        style = ttk.Style(self.root)
+        style.configure('Toolbar.TButton', padding=2)
+
+        toolbar = ttk.Frame(self.root, relief=tk.RAISED, borderwidth=1)
         toolbar.pack(side=tk.TOP, fill=tk.X)
-        
+
         # Buttons with icons (textual for simplicity)
         buttons = [
             ("New", self.new_file),
@@ -310,13 +507,14 @@ class LinuxNotepad:
             ("", None),  # Separator
             ("Find", self.find_text),
         ]
-        
+
         for text, command in buttons:
             if text == "":  # Separator
-                sep = tk.Frame(toolbar, width=2, height=20, bd=1, relief=tk.SUNKEN)
-                sep.pack(side=tk.LEFT, padx=2, pady=2)
+                ttk.Separator(toolbar, orient='vertical').pack(
+                    side=tk.LEFT, fill=tk.Y, padx=2, pady=2)
             else:
-                btn = tk.Button(toolbar, text=text, command=command, width=10)
+                btn = ttk.Button(toolbar, text=text, command=command,
+                                 width=10, style='Toolbar.TButton')
                 btn.pack(side=tk.LEFT, padx=2, pady=2)
                 
     def create_status_bar(self):
@@ -336,10 +534,9 @@ class LinuxNotepad:
         self.encoding_label = tk.Label(self.status_bar, text="UTF-8", width=10)
         self.encoding_label.pack(side=tk.RIGHT, padx=4)
         
-        # Update cursor position
-        self.text.bind('<KeyRelease>', self.update_cursor_position)
-        self.text.bind('<ButtonRelease>', self.update_cursor_position)
-        
+        # Cursor position updates ride the shared _on_key_or_click handler
+        # bound in create_text_widget
+
     def bind_linux_shortcuts(self):
         """Bind Linux hotkeys"""
         # Standard combinations
@@ -362,11 +559,16 @@ class LinuxNotepad:
             self.root.bind(key, lambda e, f=func: f())
             
     # Basic editing functions
+    def _set_current_file(self, filepath):
+        """Remember the opened file and cache its basename"""
+        self.current_file = filepath
+        self._current_basename = os.path.basename(filepath) if filepath else None
+
     def new_file(self):
         """Create new file"""
         if self.check_unsaved_changes():
             self.text.delete(1.0, tk.END)
-            self.current_file = None
+            self._set_current_file(None)
             self.update_title()
             self.update_status("New file")
             self.update_line_numbers()
@@ -389,50 +591,130 @@ class LinuxNotepad:
             if filepath:
                 self.load_file(filepath)
                 
+    @staticmethod
+    def _detect_encoding(filepath):
+        """Pick an encoding by test-decoding a small prefix of the file"""
+        with open(filepath, 'rb') as file:
+            prefix = file.read(ENCODING_SNIFF_SIZE)
+        for encoding in ENCODING_CANDIDATES:
+            # An incremental decoder tolerates a multi-byte sequence cut
+            # off at the end of the prefix instead of rejecting it
+            decoder = codecs.getincrementaldecoder(encoding)()
+            try:
+                decoder.decode(prefix)
+                return encoding
+            except UnicodeDecodeError:
+                continue
+        return None
+
     def load_file(self, filepath):
         """Load file"""
         try:
-            # Try to detect encoding
-            for encoding in ['utf-8', 'cp1251', 'iso-8859-1']:
-                try:
-                    with open(filepath, 'r', encoding=encoding) as file:
-                        content = file.read()
-                    
-                    self.text.delete(1.0, tk.END)
-                    self.text.insert(1.0, content)
-                    self.current_file = filepath
-                    self.update_title()
-                    self.update_status(f"Opened: {os.path.basename(filepath)}")
-                    self.encoding_label.config(text=encoding.upper())
-                    
-                    # Add to recent files
-                    self.add_to_recent_files(filepath)
-                    
-                    self.text.edit_modified(False)
-                    self.update_line_numbers()
-                    break
-                except UnicodeDecodeError:
-                    continue
-            else:
+            # Detect the encoding from a 64 KiB prefix, then read the file
+            # once — instead of up to three full reads, one per candidate
+            encoding = self._detect_encoding(filepath)
+            if encoding is None:
                 messagebox.showerror("Error", "Could not determine file encoding")
-                
+                return
+
+            chunks = []
+            with open(filepath, 'rb') as file:
+                while True:
+                    chunk = file.read(1 << 20)
+                    if not chunk:
+                        break
+                    chunks.append(chunk)
+            data = b''.join(chunks)
+            # Normalize CRLF/CR to LF once on the raw bytes — cheaper than
+            # replacing on the decoded string and no extra str copies
+            data = data.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+            try:
+                content = data.decode(encoding)
+            except UnicodeDecodeError:
+                # The prefix guess can miss bytes past the sniff window;
+                # fall back to the remaining candidates on the full data
+                content = None
+                for fallback in ENCODING_CANDIDATES:
+                    if fallback == encoding:
+                        continue
+                    try:
+                        content = data.decode(fallback)
+                        encoding = fallback
+                        break
+                    except UnicodeDecodeError:
+                        continue
+                if content is None:
+                    messagebox.showerror("Error", "Could not determine file encoding")
+                    return
+
+            # Turn undo off for the bulk insert so Tk doesn't allocate an
+            # undo record sized to the whole file
+            self.text.config(undo=False, autoseparators=False)
+            self.text.delete(1.0, tk.END)
+            self.text.insert(1.0, content)
+            self.text.config(undo=True, autoseparators=True)
+            self.text.edit_reset()
+            self._buf_cache = None
+
+            self._set_current_file(filepath)
+            self.update_title()
+            self.update_status(f"Opened: {self._current_basename}")
+            self.encoding_label.config(text=encoding.upper())
+
+            # Add to recent files
+            self.add_to_recent_files(filepath)
+
+            self.text.edit_modified(False)
+            self.update_line_numbers()
+
         except Exception as e:
             messagebox.showerror("Error", f"Could not open file:\n{str(e)}")
             
+    def _get_all(self):
+        """Full-buffer snapshot, cached until the next edit
+
+        Pulling the whole Text B-tree into a Python string is the
+        expensive part of format/save commands; back-to-back consumers
+        (format then save) share one copy through this cache.
+        """
+        if self._buf_cache is None:
+            self._buf_cache = self.text.get('1.0', 'end-1c')
+        return self._buf_cache
+
+    def _write_buffer(self, filepath):
+        """Write the buffer to disk as UTF-8 bytes"""
+        # Binary mode skips the text-layer re-encode; 'end-1c' leaves out
+        # the newline Tk synthesizes past the buffer, which used to grow
+        # the file by one byte on every save. Large buffers are pulled out
+        # in 10k-line chunks so peak memory stays bounded.
+        if self._buf_cache is not None:
+            # A warm snapshot (e.g. format_code just ran) skips the
+            # per-chunk extraction entirely
+            with open(filepath, 'wb') as file:
+                file.write(self._buf_cache.encode('utf-8'))
+            return
+        last_line = int(self.text.index('end-1c').split('.')[0])
+        with open(filepath, 'wb') as file:
+            for start in range(1, last_line + 1, 10000):
+                stop = start + 10000
+                if stop > last_line:
+                    chunk = self.text.get(f'{start}.0', 'end-1c')
+                else:
+                    chunk = self.text.get(f'{start}.0', f'{stop}.0')
+                file.write(chunk.encode('utf-8'))
+
     def save_file(self):
         """Save file"""
         if self.current_file:
             try:
-                content = self.text.get(1.0, tk.END)
-                with open(self.current_file, 'w', encoding='utf-8') as file:
-                    file.write(content)
-                self.update_status(f"Saved: {os.path.basename(self.current_file)}")
+                self._write_buffer(self.current_file)
+                self.update_status(f"Saved: {self._current_basename}")
                 self.text.edit_modified(False)
             except Exception as e:
                 messagebox.showerror("Error", f"Could not save file:\n{str(e)}")
         else:
             self.save_as_file()
-            
+
     def save_as_file(self):
         """Save as"""
         filepath = filedialog.asksaveasfilename(
@@ -445,16 +727,13 @@ class LinuxNotepad:
             defaultextension=".txt",
             initialdir=os.path.expanduser("~")
         )
-        
+
         if filepath:
             try:
-                content = self.text.get(1.0, tk.END)
-                with open(filepath, 'w', encoding='utf-8') as file:
-                    file.write(content)
-                
-                self.current_file = filepath
+                self._write_buffer(filepath)
+                self._set_current_file(filepath)
                 self.update_title()
-                self.update_status(f"Saved as: {os.path.basename(filepath)}")
+                self.update_status(f"Saved as: {self._current_basename}")
                 self.text.edit_modified(False)
                 self.add_to_recent_files(filepath)
             except Exception as e:
@@ -469,24 +748,18 @@ class LinuxNotepad:
             directory = os.path.expanduser("~")
             
         try:
-            # Try to open terminal depending on environment
-            terminals = ['gnome-terminal', 'konsole', 'xfce4-terminal', 'xterm']
-            for terminal in terminals:
-                if subprocess.run(['which', terminal], capture_output=True).returncode == 0:
-                    subprocess.Popen([terminal, '--working-directory', directory])
-                    break
+            if self._terminal:
+                subprocess.Popen([self._terminal, '--working-directory', directory])
         except Exception as e:
             messagebox.showwarning("Warning", f"Could not open terminal:\n{str(e)}")
-            
+
     def show_in_file_manager(self):
         """Show file in file manager"""
         if self.current_file:
             try:
-                file_managers = ['nautilus', 'dolphin', 'thunar', 'pcmanfm']
-                for fm in file_managers:
-                    if subprocess.run(['which', fm], capture_output=True).returncode == 0:
-                        subprocess.Popen([fm, os.path.dirname(self.current_file)])
-                        break
+                if self._file_manager:
+                    subprocess.Popen([self._file_manager,
+                                      os.path.dirname(self.current_file)])
             except Exception as e:
                 messagebox.showwarning("Warning", f"Could not open file manager:\n{str(e)}")
         else:
@@ -494,52 +767,132 @@ class LinuxNotepad:
             
     def run_script(self):
         """Run current script (if it's a Python file)"""
-        if self.current_file and self.current_file.endswith('.py'):
-            try:
-                result = subprocess.run(
-                    ['python3', self.current_file],
-                    capture_output=True,
-                    text=True,
-                    timeout=30
-                )
-                
-                # Show result
-                result_window = tk.Toplevel(self.root)
-                result_window.title("Execution Result")
-                result_window.geometry("600x400")
-                
-                text_widget = tk.Text(result_window, wrap=tk.WORD)
-                text_widget.pack(fill=tk.BOTH, expand=True)
-                
-                text_widget.insert(1.0, f"Exit code: {result.returncode}\n\n")
-                text_widget.insert(tk.END, "STDOUT:\n" + result.stdout + "\n\n")
-                text_widget.insert(tk.END, "STDERR:\n" + result.stderr)
-                
-            except Exception as e:
-                messagebox.showerror("Error", f"Could not run script:\n{str(e)}")
-        else:
+        if not (self.current_file and self.current_file.endswith('.py')):
             messagebox.showinfo("Information", "Save file with .py extension to run")
+            return
+
+        try:
+            proc = subprocess.Popen(
+                ['python3', self.current_file],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                bufsize=1
+            )
+        except Exception as e:
+            messagebox.showerror("Error", f"Could not run script:\n{str(e)}")
+            return
+
+        # Show result window immediately; output streams in as it arrives
+        # instead of freezing the main loop until the script exits
+        result_window = tk.Toplevel(self.root)
+        result_window.title("Execution Result")
+        result_window.geometry("600x400")
+
+        text_widget = tk.Text(result_window, wrap=tk.WORD)
+        text_widget.pack(fill=tk.BOTH, expand=True)
+
+        def drain(stream):
+            # os.read on a readable fd returns whatever is there without
+            # waiting; readline() would block until a newline arrives,
+            # hanging the UI on scripts that emit partial-line output
+            data = os.read(stream.fileno(), 4096)
+            if data and text_widget.winfo_exists():
+                text_widget.insert(tk.END, data.decode('utf-8', errors='replace'))
+
+        # Tk calls these whenever the pipes become readable (Unix only,
+        # which is all this module targets)
+        self.root.tk.createfilehandler(
+            proc.stdout, tk.READABLE, lambda f, mask: drain(proc.stdout))
+        self.root.tk.createfilehandler(
+            proc.stderr, tk.READABLE, lambda f, mask: drain(proc.stderr))
+
+        def poll_exit():
+            if proc.poll() is None:
+                self.root.after(100, poll_exit)
+                return
+            self.root.tk.deletefilehandler(proc.stdout)
+            self.root.tk.deletefilehandler(proc.stderr)
+            out, err = proc.communicate()
+            if text_widget.winfo_exists():
+                if out:
+                    text_widget.insert(tk.END, out)
+                if err:
+                    text_widget.insert(tk.END, err)
+                text_widget.insert(tk.END, f"\nExit code: {proc.returncode}\n")
+
+        poll_exit()
             
     def convert_line_endings(self):
         """Convert line endings to Linux format (LF)"""
-        content = self.text.get(1.0, tk.END)
-        content = content.replace('\r\n', '\n').replace('\r', '\n')
-        self.text.delete(1.0, tk.END)
-        self.text.insert(1.0, content)
+        # The buffer is already LF-only (endings are normalized at load
+        # time), so convert the on-disk bytes and reload — no full-buffer
+        # round-trip through the Text widget
+        if not self.current_file:
+            self.update_status("No file to convert")
+            return
+        # The reload replaces the buffer with disk content, so unsaved
+        # edits must be resolved first
+        if not self.check_unsaved_changes():
+            return
+        with open(self.current_file, 'rb') as file:
+            data = file.read()
+        normalized = data.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+        if normalized == data:
+            self.update_status("Already using Linux line endings (LF)")
+            return
+        with open(self.current_file, 'wb') as file:
+            file.write(normalized)
+        self.load_file(self.current_file)
         self.update_status("Converted to Linux line endings (LF)")
         
     # Helper functions
+    def _sync_gutter_font(self):
+        """Re-match the gutter font and width to the editor font"""
+        self._gutter_font.config(**self.editor_font.actual())
+        self._gutter_width = self._gutter_font.measure('0') * 4 + 8
+        self.line_numbers.config(width=self._gutter_width)
+        self.update_line_numbers()
+
+    def _drop_buffer_snapshot(self, event=None):
+        """Invalidate the full-buffer snapshot before a keystroke edits"""
+        # Conservative: navigation keys drop the snapshot too, but a plain
+        # attribute store is far cheaper than tracking which keys edit
+        self._buf_cache = None
+
+    def _on_key_or_click(self, event=None):
+        """Shared KeyRelease/ButtonRelease handler: cursor pos and gutter"""
+        self.update_cursor_position(event)
+        self.update_line_numbers(event)
+
+    def _on_text_scroll(self, first, last):
+        """Forward scroll info to the scrollbar and refresh the gutter"""
+        self._v_scrollbar.set(first, last)
+        self.update_line_numbers()
+
     def update_line_numbers(self, event=None):
-        """Update line numbers"""
-        self.line_numbers.config(state='normal')
-        self.line_numbers.delete(1.0, tk.END)
-        
-        line_count = self.text.get(1.0, tk.END).count('\n')
-        
-        for line in range(1, line_count + 2):
-            self.line_numbers.insert(tk.END, f"{line}\n")
-            
-        self.line_numbers.config(state='disabled')
+        """Schedule a debounced line-number refresh"""
+        if self._gutter_after:
+            self.root.after_cancel(self._gutter_after)
+        self._gutter_after = self.root.after(50, self._refresh_line_numbers)
+
+    def _refresh_line_numbers(self):
+        """Redraw line numbers for the visible viewport only"""
+        self._gutter_after = None
+        gutter = self.line_numbers
+        gutter.delete('all')
+
+        # Walk the on-screen display lines; dlineinfo returns None as soon
+        # as a line falls below the viewport, so this is O(visible lines)
+        index = self.text.index('@0,0')
+        while True:
+            dline = self.text.dlineinfo(index)
+            if dline is None:
+                break
+            gutter.create_text(self._gutter_width - 4, dline[1], anchor='ne',
+                               font=self._gutter_font,
+                               text=index.split('.')[0])
+            index = self.text.index(f'{index}+1line')
         
     def update_cursor_position(self, event=None):
         """Update cursor position"""
@@ -554,8 +907,7 @@ class LinuxNotepad:
     def update_title(self):
         """Update window title"""
         if self.current_file:
-            filename = os.path.basename(self.current_file)
-            self.root.title(f"{filename} - Linux Notepad")
+            self.root.title(f"{self._current_basename} - Linux Notepad")
         else:
             self.root.title("New file - Linux Notepad")
             
@@ -578,20 +930,38 @@ class LinuxNotepad:
         return True
         
     def on_text_modified(self, event=None):
-        """Text modification handler"""
+        """Text modification handler (runs only on actual state changes)"""
+        self._buf_cache = None
+        modified = bool(self.text.edit_modified())
+        if modified == self._last_modified_state:
+            return  # Tk can fire <<Modified>> without a state flip
+        self._last_modified_state = modified
+        if self._modified_after:
+            self.root.after_cancel(self._modified_after)
+        self._modified_after = self.root.after(100, self._flush_modified_status)
+
+    def _flush_modified_status(self):
+        """Reflect the settled modified state in the status bar"""
+        self._modified_after = None
         if self.text.edit_modified():
             self.update_status("Unsaved changes")
         else:
             if self.current_file:
-                self.update_status(os.path.basename(self.current_file))
+                self.update_status(self._current_basename)
             else:
                 self.update_status("New file")
                 
     def on_window_resize(self, event):
-        """Window resize handler"""
+        """Window resize handler (only the final geometry is persisted)"""
         if event.widget == self.root:
-            geometry = self.root.geometry()
-            self.save_config('window', 'geometry', geometry)
+            if self._resize_after:
+                self.root.after_cancel(self._resize_after)
+            self._resize_after = self.root.after(500, self._save_geometry)
+
+    def _save_geometry(self):
+        """Persist the settled window geometry"""
+        self._resize_after = None
+        self.save_config('window', 'geometry', self.root.geometry())
             
     # Configuration functions
     def load_config(self):
@@ -609,41 +979,60 @@ class LinuxNotepad:
         }
         config['recent'] = {'max_files': '10'}
         
-        if self.config_file.exists():
-            config.read(self.config_file)
-            
+        # config.read silently skips a missing file; no need for a
+        # separate exists() stat first
+        config.read(self.config_file)
+
         return config
         
     def save_config(self, section, key, value):
-        """Save configuration parameter"""
+        """Record a configuration change (flushed to disk later)"""
         if section not in self.config:
             self.config[section] = {}
         self.config[section][key] = value
-        
-        with open(self.config_file, 'w') as f:
-            self.config.write(f)
-            
+        self._config_dirty = True
+
+    def _flush_dirty_state(self, reschedule=True):
+        """Write config and recent files to disk if they changed"""
+        if self._config_dirty:
+            self._config_dirty = False
+            with open(self.config_file, 'w') as f:
+                self.config.write(f)
+        if self._recent_dirty:
+            self._recent_dirty = False
+            # One join + one write, staged through a temp file so a crash
+            # mid-flush never leaves a truncated recents list behind
+            tmp_path = str(self.recent_files_file) + '.tmp'
+            with open(tmp_path, 'w') as f:
+                f.write('\n'.join(self.recent_files))
+            os.replace(tmp_path, self.recent_files_file)
+        if reschedule:
+            self.root.after(5000, self._flush_dirty_state)
+
     def load_recent_files(self):
-        """Load recent files list"""
-        if self.recent_files_file.exists():
-            with open(self.recent_files_file, 'r') as f:
-                return [line.strip() for line in f if line.strip()]
-        return []
-        
+        """Load recent files (an ordered set, most recent first)"""
+        # An OrderedDict keyed by path gives O(1) dedup and move-to-front,
+        # where the old list paid an O(n) remove + insert(0) per open.
+        # Opening directly and catching FileNotFoundError halves the
+        # syscalls of the old exists()-then-open dance.
+        try:
+            data = self.recent_files_file.read_text()
+        except FileNotFoundError:
+            return OrderedDict()
+        return OrderedDict((line.strip(), None) for line in data.split('\n') if line.strip())
+
     def add_to_recent_files(self, filepath):
         """Add file to recent files"""
-        if filepath in self.recent_files:
-            self.recent_files.remove(filepath)
-        self.recent_files.insert(0, filepath)
-        
+        self.recent_files[filepath] = None
+        self.recent_files.move_to_end(filepath, last=False)
+
         # Limit number of files
         max_files = self.config.getint('recent', 'max_files', fallback=10)
-        self.recent_files = self.recent_files[:max_files]
-        
-        # Save
-        with open(self.recent_files_file, 'w') as f:
-            for file in self.recent_files:
-                f.write(file + '\n')
+        while len(self.recent_files) > max_files:
+            self.recent_files.popitem(last=True)
+
+        # Written out by the periodic/exit flush
+        self._recent_dirty = True
                 
     def load_last_file(self):
         """Load last opened file"""
@@ -696,12 +1085,16 @@ class LinuxNotepad:
         find_entry = tk.Entry(find_dialog, width=40)
         find_entry.pack(pady=5)
         
+        # Tk reports the match length here, in Tk character units
+        match_len = tk.IntVar()
+
         def find_next():
             text_to_find = find_entry.get()
             if text_to_find:
-                start_pos = self.text.search(text_to_find, tk.INSERT, nocase=True, stopindex=tk.END)
+                start_pos = self.text.search(text_to_find, tk.INSERT, nocase=True,
+                                             stopindex=tk.END, count=match_len)
                 if start_pos:
-                    end_pos = f"{start_pos}+{len(text_to_find)}c"
+                    end_pos = f"{start_pos}+{match_len.get()}c"
                     self.text.tag_remove(tk.SEL, 1.0, tk.END)
                     self.text.tag_add(tk.SEL, start_pos, end_pos)
                     self.text.mark_set(tk.INSERT, end_pos)
@@ -715,16 +1108,18 @@ class LinuxNotepad:
         font_dialog.title("Select Font")
         font_dialog.geometry("300x200")
         
-        # Font list
-        available_fonts = sorted(font.families())
-        
         tk.Label(font_dialog, text="Font:").pack(pady=5)
         font_listbox = tk.Listbox(font_dialog, height=6)
         font_listbox.pack(pady=5, fill=tk.BOTH, expand=True)
-        
-        for font_name in available_fonts:
-            font_listbox.insert(tk.END, font_name)
-            
+
+        if LinuxNotepad._font_families_cache is None:
+            # font.families() can block for hundreds of ms on systems with
+            # large fontconfig caches; enumerate after the dialog paints
+            # and keep the result for the rest of the process
+            self.root.after_idle(self._load_font_families, font_listbox)
+        else:
+            font_listbox.insert(tk.END, *LinuxNotepad._font_families_cache)
+
         tk.Label(font_dialog, text="Size:").pack(pady=5)
         size_spinbox = tk.Spinbox(font_dialog, from_=8, to=72, width=5)
         size_spinbox.pack(pady=5)
@@ -732,27 +1127,44 @@ class LinuxNotepad:
         def apply_font():
             selected_font = font_listbox.get(font_listbox.curselection())
             size = int(size_spinbox.get())
-            self.text.config(font=(selected_font, size))
+            self.editor_font.config(family=selected_font, size=size)
+            self._sync_gutter_font()
             self.save_config('editor', 'font_family', selected_font)
             self.save_config('editor', 'font_size', str(size))
             font_dialog.destroy()
             
         tk.Button(font_dialog, text="Apply", command=apply_font).pack(pady=10)
-        
+
+    def _load_font_families(self, listbox):
+        """Enumerate and cache font families, then fill the listbox"""
+        if LinuxNotepad._font_families_cache is None:
+            LinuxNotepad._font_families_cache = tuple(sorted(font.families()))
+        if listbox.winfo_exists():
+            # Starred insert: the whole list goes over in one Tcl call
+            listbox.insert(tk.END, *LinuxNotepad._font_families_cache)
+
     def increase_font(self):
         """Increase font size"""
-        current_font = self.text.cget('font')
-        font_name, font_size = current_font
-        new_size = int(font_size) + 1
-        self.text.config(font=(font_name, new_size))
-        self.save_config('editor', 'font_size', str(new_size))
-        
+        self._queue_zoom(1)
+
     def decrease_font(self):
         """Decrease font size"""
-        current_font = self.text.cget('font')
-        font_name, font_size = current_font
-        new_size = max(8, int(font_size) - 1)  # Minimum 8
-        self.text.config(font=(font_name, new_size))
+        self._queue_zoom(-1)
+
+    def _queue_zoom(self, delta):
+        """Accumulate a zoom step; a burst of keypresses becomes one resize"""
+        self._zoom_pending += delta
+        if self._zoom_after is None:
+            self._zoom_after = self.root.after(30, self._apply_zoom)
+
+    def _apply_zoom(self):
+        """Apply all pending zoom steps in a single font reconfigure"""
+        self._zoom_after = None
+        delta, self._zoom_pending = self._zoom_pending, 0
+        new_size = max(8, self.editor_font['size'] + delta)  # Minimum 8
+        if new_size != self.editor_font['size']:
+            self.editor_font.config(size=new_size)
+            self._sync_gutter_font()
         self.save_config('editor', 'font_size', str(new_size))
         
     def convert_to_utf8(self):
@@ -763,58 +1175,54 @@ class LinuxNotepad:
         """Check syntax (for Python)"""
         if self.current_file and self.current_file.endswith('.py'):
             try:
-                result = subprocess.run(
-                    ['python3', '-m', 'py_compile', self.current_file],
-                    capture_output=True,
-                    text=True
-                )
-                if result.returncode == 0:
+                mtime = os.stat(self.current_file).st_mtime_ns
+                # Same file, same mtime: the verdict cannot have changed
+                if self._syntax_cache == (self.current_file, mtime):
                     messagebox.showinfo("Syntax", "Python syntax is correct")
-                else:
-                    messagebox.showerror("Syntax", f"Syntax error:\n{result.stderr}")
+                    return
+                with open(self.current_file, 'rb') as f:
+                    source = f.read()
+                ast.parse(source, filename=self.current_file)
+            except SyntaxError as e:
+                messagebox.showerror("Syntax", f"Syntax error:\nLine {e.lineno}: {e.msg}")
             except Exception as e:
                 messagebox.showerror("Error", f"Could not check syntax:\n{str(e)}")
+            else:
+                self._syntax_cache = (self.current_file, mtime)
+                messagebox.showinfo("Syntax", "Python syntax is correct")
         else:
             messagebox.showinfo("Information", "Function available only for Python files")
             
     def calculate_expression(self):
         """Calculate mathematical expression"""
+        if self.text.tag_ranges(tk.SEL):
+            expression = self.text.get(tk.SEL_FIRST, tk.SEL_LAST).strip()
+        else:
+            expression = simpledialog.askstring("Calculation", "Enter expression:")
+        if not expression:
+            return
+
         try:
-            selected_text = self.text.get(tk.SEL_FIRST, tk.SEL_LAST)
-            if selected_text:
-                result = eval(selected_text)
-                messagebox.showinfo("Result", f"{selected_text} = {result}")
-        except:
-            expression = tk.simpledialog.askstring("Calculation", "Enter expression:")
-            if expression:
-                try:
-                    result = eval(expression)
-                    messagebox.showinfo("Result", f"{expression} = {result}")
-                except Exception as e:
-                    messagebox.showerror("Error", f"Invalid expression:\n{str(e)}")
+            result = _evaluate_expression(expression)
+        except (SyntaxError, ValueError, TypeError, ArithmeticError) as e:
+            messagebox.showerror("Error", f"Invalid expression:\n{str(e)}")
+            return
+        messagebox.showinfo("Result", f"{expression} = {result}")
                     
     def format_code(self):
         """Format code (basic implementation)"""
-        content = self.text.get(1.0, tk.END)
-        # Simple formatting - adding indents
-        lines = content.split('\n')
-        formatted_lines = []
-        indent_level = 0
-        
-        for line in lines:
-            stripped = line.strip()
-            if stripped.endswith(':'):
-                formatted_lines.append(' ' * (indent_level * 4) + line.strip())
-                indent_level += 1
-            elif stripped and stripped[0] in ')]}':
-                indent_level = max(0, indent_level - 1)
-                formatted_lines.append(' ' * (indent_level * 4) + line.strip())
-            else:
-                formatted_lines.append(' ' * (indent_level * 4) + line.strip())
-                
-        formatted_text = '\n'.join(formatted_lines)
-        self.text.delete(1.0, tk.END)
-        self.text.insert(1.0, formatted_text)
+        content = self._get_all()
+        formatted_text = _format_lines(content)
+        if formatted_text == content:
+            self.update_status("Already formatted")
+            return
+        # Single replace keeps marks/scroll position and undoes as one step
+        self.text.edit_separator()
+        self.text.replace('1.0', 'end-1c', formatted_text)
+        self.text.edit_separator()
+        # The result is known exactly, so hand it to the snapshot cache: a
+        # save right after formatting skips the full-buffer extraction
+        self._buf_cache = formatted_text
         self.update_status("Code formatted")
         
     def go_to_line(self):
@@ -828,40 +1236,44 @@ class LinuxNotepad:
     # Text editing functions
     def undo_text(self):
         """Undo action"""
-        try:
+        # Asking Tk first avoids the TclError raise/catch round-trip when
+        # the stack is empty (repeated Ctrl+Z at the bottom is common)
+        if self.text.tk.getboolean(self.text.edit('canundo')):
+            self._buf_cache = None
             self.text.edit_undo()
-        except:
-            pass
-            
+
     def redo_text(self):
         """Redo action"""
-        try:
+        if self.text.tk.getboolean(self.text.edit('canredo')):
+            self._buf_cache = None
             self.text.edit_redo()
-        except:
-            pass
             
     def cut_text(self):
         """Cut text"""
+        self._buf_cache = None
         self.text.event_generate("<<Cut>>")
-        
+
     def copy_text(self):
         """Copy text"""
         self.text.event_generate("<<Copy>>")
         
     def paste_text(self):
         """Paste text"""
+        self._buf_cache = None
         self.text.event_generate("<<Paste>>")
-        
+
     def delete_text(self):
         """Delete selected text"""
-        try:
+        if self.text.tag_ranges(tk.SEL):
+            self._buf_cache = None
             self.text.delete(tk.SEL_FIRST, tk.SEL_LAST)
-        except:
-            pass
             
     def select_all(self):
         """Select all text"""
-        self.text.tag_add('sel', '1.0', 'end')
+        self.text.tag_remove('sel', '1.0', 'end')
+        self.text.tag_add('sel', '1.0', 'end-1c')
+        self.text.mark_set('insert', '1.0')
+        return 'break'
         
     # Help and information functions
     def show_help(self):
@@ -882,37 +1294,22 @@ class LinuxNotepad:
             
     def show_manual(self):
         """Show user manual"""
-        manual_text = """LINUX NOTEPAD USER MANUAL
+        # Build the window once and hide it on close; reopening Help then
+        # only costs a deiconify instead of a fresh widget tree
+        if self._manual_window is None:
+            self._manual_window = tk.Toplevel(self.root)
+            self._manual_window.title("User Manual")
+            self._manual_window.geometry("600x500")
+            self._manual_window.protocol('WM_DELETE_WINDOW',
+                                         self._manual_window.withdraw)
 
-1. EDITING FILES
-   - Use standard cut/copy/paste commands
-   - Configure font through Format menu
-   - Enable word wrap for comfortable reading
-
-2. WORKING WITH FILES
-   - Save files in any format
-   - Open files in different encodings
-   - Use recent files list for quick access
-
-3. TOOLS
-   - Python syntax checking
-   - Run scripts directly from editor
-   - Code formatting
-   - Line ending conversion
-
-4. LINUX INTEGRATION
-   - Open terminal in current folder
-   - View files in file manager
-   - Automatic system theme detection"""
-        
-        help_window = tk.Toplevel(self.root)
-        help_window.title("User Manual")
-        help_window.geometry("600x500")
-        
-        text_widget = tk.Text(help_window, wrap=tk.WORD)
-        text_widget.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        text_widget.insert(1.0, manual_text)
-        text_widget.config(state='disabled')
+            text_widget = tk.Text(self._manual_window, wrap=tk.WORD)
+            text_widget.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+            text_widget.insert(1.0, _MANUAL_TEXT)
+            text_widget.config(state='disabled')
+        else:
+            self._manual_window.deiconify()
+            self._manual_window.lift()
         
     def about_app(self):
         """About application"""
@@ -928,20 +1325,10 @@ class LinuxNotepad:
             
     def show_system_info(self):
         """Show system information"""
-        info = f"""
-System Information:
-
-OS: {platform.system()} {platform.release()}
-Architecture: {platform.machine()}
-Processor: {platform.processor()}
-
-Python: {platform.python_version()}
-Tkinter: {tk.TkVersion}
-
-Current file: {self.current_file or 'Not opened'}
-Encoding: {self.encoding_label.cget('text')}
-        """
-        messagebox.showinfo("System Information", info.strip())
+        info = (f"{_SYS_INFO_STATIC}\n\n"
+                f"Current file: {self.current_file or 'Not opened'}\n"
+                f"Encoding: {self.encoding_label.cget('text')}")
+        messagebox.showinfo("System Information", info)
         
     def exit_app(self):
         """Exit application"""
@@ -949,6 +1336,7 @@ Encoding: {self.encoding_label.cget('text')}
             # Save current file to configuration
             if self.current_file:
                 self.save_config('last_session', 'file', self.current_file)
+            self._flush_dirty_state(reschedule=False)
             self.root.quit()
             
     def open_recent_file(self, filepath):
@@ -958,14 +1346,11 @@ Encoding: {self.encoding_label.cget('text')}
                 self.load_file(filepath)
             else:
                 messagebox.showwarning("File Not Found", f"File does not exist:\n{filepath}")
-                # Remove from recent files
+                # Remove from recent files; the postcommand rebuilds the
+                # submenu on its next post, so no menu work is needed here
                 if filepath in self.recent_files:
-                    self.recent_files.remove(filepath)
-                    with open(self.recent_files_file, 'w') as f:
-                        for file in self.recent_files:
-                            f.write(file + '\n')
-                    # Update menu
-                    self.create_menu()
+                    del self.recent_files[filepath]
+                    self._recent_dirty = True
 
 # Entry point
 def main():
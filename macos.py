@@ -1,23 +1,57 @@
 import tkinter as tk
-from tkinter import filedialog, messagebox
+from tkinter import filedialog, messagebox, font
 import os
 
+# Large documents are inserted in slabs of roughly this many characters so
+# the UI stays responsive while the Text widget builds its B-tree
+CHUNK_SIZE = 262144
+
+# Status-bar messages shown on every edit transition; module constants so
+# the handlers never re-allocate them
+_STATUS_READY = "Ready"
+_STATUS_MODIFIED = "Modified"
+
 class NotepadApp:
+    # Command-key handlers live on the shared 'all' bindtag, installed
+    # once per process; each window registers here so the dispatcher can
+    # route an event to the app that owns its toplevel
+    _bindings_installed = False
+    _instances = {}
+
+    _KEY_BINDINGS = (
+        ('<Command-q>', 'exit_app'),
+        ('<Command-n>', 'new_file'),
+        ('<Command-o>', 'open_file'),
+        ('<Command-s>', 'save_file'),
+        ('<Shift-Command-s>', 'save_as_file'),
+        ('<Command-a>', 'select_all'),
+    )
+
+    @classmethod
+    def _dispatch_key(cls, event, method_name):
+        app = cls._instances.get(str(event.widget.winfo_toplevel()))
+        if app is not None:
+            getattr(app, method_name)()
+
     def __init__(self, root):
         self.root = root
         self.root.title("Untitled - Notepad")
         self.root.geometry("800x600")
-        
+
         # For macOS window focus and events
-        self.root.bind('<Command-q>', lambda e: self.exit_app())
-        self.root.bind('<Command-n>', lambda e: self.new_file())
-        self.root.bind('<Command-o>', lambda e: self.open_file())
-        self.root.bind('<Command-s>', lambda e: self.save_file())
-        self.root.bind('<Shift-Command-s>', lambda e: self.save_as_file())
-        self.root.bind('<Command-a>', lambda e: self.select_all())
-        
+        NotepadApp._instances[str(root)] = self
+        if not NotepadApp._bindings_installed:
+            for sequence, method_name in self._KEY_BINDINGS:
+                root.bind_class('all', sequence,
+                                lambda e, m=method_name: NotepadApp._dispatch_key(e, m))
+            NotepadApp._bindings_installed = True
+
         # Currently opened file
         self.current_file = None
+        self._current_basename = "Untitled"  # Cached; basename() is not free
+        self._status_opened = "Opened: Untitled"
+        self._loading = False  # True while a document is streaming in
+        self._is_dirty = False  # Mirrors edit_modified() between transitions
         
         # Create menu (macOS style)
         self.create_menu()
@@ -26,7 +60,7 @@ class NotepadApp:
         self.create_text_widget()
         
         # Add status bar
-        self.status_bar = tk.Label(root, text="Ready", bd=1, relief=tk.SUNKEN, anchor=tk.W)
+        self.status_bar = tk.Label(root, text=_STATUS_READY, bd=1, relief=tk.SUNKEN, anchor=tk.W)
         self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
         
         # Bind event handlers
@@ -124,6 +158,12 @@ class NotepadApp:
         scrollbar_x = tk.Scrollbar(text_frame, orient=tk.HORIZONTAL)
         scrollbar_x.pack(side=tk.BOTTOM, fill=tk.X)
         
+        # Named editor font: zoom mutates this object in place instead of
+        # re-parsing the widget's font string on each step
+        self.editor_font = font.Font(family="Monaco", size=11)
+        self._zoom_pending = 0  # Accumulated zoom steps not yet applied
+        self._zoom_after = None
+
         # Text widget
         self.text = tk.Text(
             text_frame,
@@ -131,7 +171,7 @@ class NotepadApp:
             undo=True,      # Enable undo functionality
             yscrollcommand=scrollbar_y.set,
             xscrollcommand=scrollbar_x.set,
-            font=("Monaco", 11),  # macOS default monospaced font
+            font=self.editor_font,  # macOS default monospaced font
             bg='white',
             fg='black',
             insertbackground='black',  # Cursor color
@@ -148,17 +188,27 @@ class NotepadApp:
         # Set default word wrap state
         self.word_wrap_enabled = True
         
+    def _set_current_file(self, file_path):
+        """Track the open file and cache its basename for titles/statuses"""
+        self.current_file = file_path
+        self._current_basename = os.path.basename(file_path) if file_path else "Untitled"
+        self._status_opened = f"Opened: {self._current_basename}"
+
     def new_file(self):
         """Create a new file"""
+        if self._loading:
+            return
         if self.check_unsaved_changes():
             self.text.delete(1.0, tk.END)
-            self.current_file = None
+            self._set_current_file(None)
             self.update_title()
             self.update_status("New file created")
             self.text.focus_set()
             
     def open_file(self):
         """Open file through file dialog with macOS options"""
+        if self._loading:
+            return
         if self.check_unsaved_changes():
             file_path = filedialog.askopenfilename(
                 title="Open",
@@ -176,42 +226,116 @@ class NotepadApp:
             
             if file_path:
                 try:
-                    with open(file_path, 'r', encoding='utf-8') as file:
-                        content = file.read()
-                    
-                    self.text.delete(1.0, tk.END)
-                    self.text.insert(1.0, content)
-                    self.current_file = file_path
-                    self.update_title()
-                    self.update_status(f"Opened: {os.path.basename(file_path)}")
-                    self.text.focus_set()
-                    self.text.edit_modified(False)
-                    
-                except UnicodeDecodeError:
-                    # Try different encoding
+                    data = self._read_bytes(file_path)
+                    # Decode in memory: a failed utf-8 attempt falls back to
+                    # latin-1 without touching the disk a second time
                     try:
-                        with open(file_path, 'r', encoding='latin-1') as file:
-                            content = file.read()
-                        self.text.delete(1.0, tk.END)
-                        self.text.insert(1.0, content)
-                        self.current_file = file_path
-                        self.update_title()
-                        self.update_status(f"Opened with alternative encoding: {os.path.basename(file_path)}")
-                        self.text.focus_set()
-                        self.text.edit_modified(False)
-                    except Exception as e:
-                        messagebox.showerror("Error", f"Failed to open file:\n{str(e)}")
+                        content = data.decode('utf-8')
+                        status = None  # Default "Opened: <name>" on completion
+                    except UnicodeDecodeError:
+                        content = data.decode('latin-1')
+                        status = (f"Opened with alternative encoding: "
+                                  f"{os.path.basename(file_path)}")
+
+                    self._load_content(content, file_path, status)
                 except Exception as e:
                     messagebox.showerror("Error", f"Failed to open file:\n{str(e)}")
-                    
+
+    def _load_content(self, content, file_path, status=None):
+        """Replace the buffer, streaming big documents in via the idle loop
+
+        current_file is only switched in _finish_load, so until the last
+        chunk lands no save command can target the file being opened.
+        """
+        self._loading = True
+        self.text.config(undo=False)
+        self.text.delete(1.0, tk.END)
+        if len(content) <= CHUNK_SIZE:
+            self.text.insert(1.0, content)
+            self._finish_load(file_path, status)
+        else:
+            self.root.after_idle(self._insert_next_chunk,
+                                 self._split_chunks(content), 0, file_path, status)
+
+    @staticmethod
+    def _split_chunks(content):
+        """Split content into insert slabs snapped to line boundaries"""
+        chunks = []
+        start = 0
+        length = len(content)
+        while start < length:
+            end = start + CHUNK_SIZE
+            if end < length:
+                newline = content.find('\n', end)
+                end = newline + 1 if newline != -1 else length
+            chunks.append(content[start:end])
+            start = end
+        return chunks
+
+    def _insert_next_chunk(self, chunks, index, file_path, status):
+        """Insert one slab per idle callback until the document is in"""
+        self.text.insert(tk.END, chunks[index])
+        index += 1
+        if index < len(chunks):
+            self.root.after_idle(self._insert_next_chunk, chunks, index,
+                                 file_path, status)
+        else:
+            self._finish_load(file_path, status)
+
+    def _finish_load(self, file_path, status=None):
+        """Re-arm undo and modified tracking once loading is complete"""
+        self._set_current_file(file_path)
+        if status is None:
+            status = self._status_opened
+        self.text.config(undo=True)
+        self.text.edit_reset()
+        self.text.mark_set(tk.INSERT, "1.0")
+        self._loading = False
+        self.update_title()
+        self.update_status(status)
+        self.text.focus_set()
+        self.text.edit_modified(False)
+
+    @staticmethod
+    def _read_bytes(file_path):
+        """Read a whole file into a preallocated buffer sized via fstat"""
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            size = os.fstat(fd).st_size
+            buf = bytearray(size)
+            view = memoryview(buf)
+            pos = 0
+            while pos < size:
+                n = os.readv(fd, [view[pos:]])
+                if n == 0:
+                    del view
+                    return bytes(buf[:pos])
+                pos += n
+            del view
+            return bytes(buf)
+        finally:
+            os.close(fd)
+
+    def _write_file(self, file_path):
+        """Write the buffer atomically: encode once, stage, then swap in"""
+        # end-1c stops Tk's synthetic trailing newline from growing the
+        # file by one byte per save
+        data = self.text.get(1.0, 'end-1c').encode('utf-8')
+        tmp_path = file_path + '.tmp'
+        with open(tmp_path, 'wb') as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, file_path)
+
     def save_file(self):
         """Save file"""
+        if self._loading:
+            return  # Never write a half-streamed buffer over a file
         if self.current_file:
             try:
-                content = self.text.get(1.0, tk.END)
-                with open(self.current_file, 'w', encoding='utf-8') as file:
-                    file.write(content)
-                self.update_status(f"Saved: {os.path.basename(self.current_file)}")
+                self._write_file(self.current_file)
+                self.update_status(f"Saved: {self._current_basename}")
                 self.text.edit_modified(False)
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to save file:\n{str(e)}")
@@ -220,6 +344,8 @@ class NotepadApp:
             
     def save_as_file(self):
         """Save file as... through file dialog"""
+        if self._loading:
+            return
         file_path = filedialog.asksaveasfilename(
             title="Save As",
             filetypes=[
@@ -234,13 +360,10 @@ class NotepadApp:
         
         if file_path:
             try:
-                content = self.text.get(1.0, tk.END)
-                with open(file_path, 'w', encoding='utf-8') as file:
-                    file.write(content)
-                
-                self.current_file = file_path
+                self._write_file(file_path)
+                self._set_current_file(file_path)
                 self.update_title()
-                self.update_status(f"Saved as: {os.path.basename(file_path)}")
+                self.update_status(f"Saved as: {self._current_basename}")
                 self.text.edit_modified(False)
                 self.text.focus_set()
             except Exception as e:
@@ -251,7 +374,7 @@ class NotepadApp:
         if self.text.edit_modified():
             response = messagebox.askyesnocancel(
                 "Save Changes",
-                f"Do you want to save the changes you made to the document \"{os.path.basename(self.current_file) if self.current_file else 'Untitled'}\"?",
+                f"Do you want to save the changes you made to the document \"{self._current_basename}\"?",
                 default=messagebox.YES,  # macOS default
                 icon=messagebox.WARNING
             )
@@ -268,11 +391,7 @@ class NotepadApp:
         
     def update_title(self):
         """Update window title"""
-        if self.current_file:
-            filename = os.path.basename(self.current_file)
-            self.root.title(f"{filename} - Notepad")
-        else:
-            self.root.title("Untitled - Notepad")
+        self._refresh_title()
             
     def update_status(self, message):
         """Update status bar"""
@@ -280,19 +399,24 @@ class NotepadApp:
         
     def on_text_modified(self, event=None):
         """Text modification handler"""
-        if self.text.edit_modified():
-            # Add dot to title for unsaved changes
-            title = self.root.title()
-            if not title.startswith("• "):
-                self.root.title(f"• {title}")
-            self.update_status("Modified")
+        if self._loading:
+            return
+        dirty = bool(self.text.edit_modified())
+        if dirty == self._is_dirty:
+            return  # No transition; nothing to redraw
+        self._is_dirty = dirty
+        self._refresh_title()
+        if dirty:
+            self.update_status(_STATUS_MODIFIED)
         else:
-            # Remove dot from title
-            title = self.root.title()
-            if title.startswith("• "):
-                self.root.title(title[2:])
-            self.update_status("Ready")
-            
+            self.update_status(_STATUS_READY)
+
+    def _refresh_title(self):
+        """Rebuild the window title from cached state in one call"""
+        dot = "• " if self._is_dirty else ""
+        self.root.title(f"{dot}{self._current_basename} - Notepad")
+
+
     def undo_text(self):
         """Undo last action"""
         try:
@@ -384,19 +508,29 @@ class NotepadApp:
             
     def zoom_in(self):
         """Zoom in text"""
-        current_size = int(self.text['font'].split()[1])
-        if current_size < 72:  # Max size
-            self.text.config(font=("Monaco", current_size + 1))
-            
+        self._queue_zoom(1)
+
     def zoom_out(self):
         """Zoom out text"""
-        current_size = int(self.text['font'].split()[1])
-        if current_size > 6:  # Min size
-            self.text.config(font=("Monaco", current_size - 1))
-            
+        self._queue_zoom(-1)
+
+    def _queue_zoom(self, delta):
+        """Accumulate a zoom step; held keys coalesce into one resize"""
+        self._zoom_pending += delta
+        if self._zoom_after is None:
+            self._zoom_after = self.root.after(30, self._apply_zoom)
+
+    def _apply_zoom(self):
+        """Apply all pending zoom steps with a single font reconfigure"""
+        self._zoom_after = None
+        delta, self._zoom_pending = self._zoom_pending, 0
+        new_size = min(72, max(6, self.editor_font['size'] + delta))
+        if new_size != self.editor_font['size']:
+            self.editor_font.config(size=new_size)
+
     def reset_zoom(self):
         """Reset zoom to default"""
-        self.text.config(font=("Monaco", 11))
+        self.editor_font.config(size=11)
         
     def minimize_window(self):
         """Minimize window"""
@@ -442,6 +576,8 @@ Features:
         
     def exit_app(self):
         """Exit the program"""
+        if self._loading:
+            return  # Let the in-flight load finish first
         if self.check_unsaved_changes():
             self.root.quit()
 